@@ -38,7 +38,6 @@ help for more information on saving cropping shapes.
 """
 
 import logging
-import math
 
 import centrosome.filter
 import matplotlib.axes
@@ -108,12 +107,30 @@ D_FIRST_CROPPING = "FirstCropping"
 D_FIRST_CROPPING_MASK = "FirstCroppingMask"
 
 
+def _pack_mask(mask):
+    """Bit-pack a boolean mask along with its shape for caching
+
+    The packed form holds one bit per pixel instead of one byte, so a
+    mask cached across cycles takes an eighth of the memory.
+    """
+    return mask.shape, numpy.packbits(mask)
+
+
+def _unpack_mask(shape, bits):
+    """Restore a boolean mask cached by _pack_mask"""
+    return numpy.unpackbits(bits, count=shape[0] * shape[1]).reshape(shape).astype(bool)
+
+
 class Crop(Module):
     module_name = "Crop"
     variable_revision_number = 3
     category = "Image Processing"
 
     def create_settings(self):
+        # Cache of (geometry key, mask) for the last ellipse cropping computed,
+        # so unchanged geometry does not rebuild the mask every cycle
+        self.__ellipse_cache = None
+
         self.image_name = ImageSubscriber(
             text="Select the input image",
             value="None",
@@ -408,21 +425,22 @@ objects:
         )
         save_flag = self.individual_or_once == IO_FIRST and first_image_set
         if not recalculate_flag:
-            if d[D_FIRST_CROPPING].shape != orig_image.pixel_data.shape[:2]:
+            if d[D_FIRST_CROPPING][0] != orig_image.pixel_data.shape[:2]:
                 recalculate_flag = True
                 logging.warning(
                     """Image, "%s", size changed from %s to %s during cycle %d, recalculating""",
                     self.image_name.value,
-                    str(d[D_FIRST_CROPPING].shape),
+                    str(d[D_FIRST_CROPPING][0]),
                     str(orig_image.pixel_data.shape[:2]),
                     workspace.image_set.image_number,
                 )
         mask = None  # calculate the mask after cropping unless set below
         cropping = None
+        cropping_area = None  # counted from the mask unless known analytically
         masking_objects = None
         if not recalculate_flag:
-            cropping = d[D_FIRST_CROPPING]
-            mask = d[D_FIRST_CROPPING_MASK]
+            cropping = _unpack_mask(*d[D_FIRST_CROPPING])
+            mask = _unpack_mask(*d[D_FIRST_CROPPING_MASK])
         elif self.shape == SH_CROPPING:
             cropping_image = workspace.image_set.get_image(
                 self.cropping_mask_source.value
@@ -442,13 +460,17 @@ objects:
         elif self.shape == SH_ELLIPSE:
             cropping = self.get_ellipse_cropping(workspace, orig_image)
         elif self.shape == SH_RECTANGLE:
-            cropping = self.get_rectangle_cropping(workspace, orig_image)
+            cropping, cropping_area = self.get_rectangle_cropping(orig_image)
         if self.remove_rows_and_columns == RM_NO:
-            cropped_pixel_data = orig_image.pixel_data.copy()
-            if cropped_pixel_data.ndim == 3:
-                cropped_pixel_data[~cropping, :] = 0
+            if cropping.all():
+                # Nothing is masked out - pass the pixel data through unchanged
+                cropped_pixel_data = orig_image.pixel_data
+            elif orig_image.pixel_data.ndim == 3:
+                cropped_pixel_data = (
+                    orig_image.pixel_data * cropping[:, :, numpy.newaxis]
+                )
             else:
-                cropped_pixel_data[numpy.logical_not(cropping)] = 0
+                cropped_pixel_data = orig_image.pixel_data * cropping
             if mask is None:
                 mask = cropping
             if orig_image.has_mask:
@@ -470,9 +492,13 @@ objects:
                 image_mask = mask
 
             if cropped_pixel_data.ndim == 3:
-                cropped_pixel_data[~mask, :] = 0
+                numpy.multiply(
+                    cropped_pixel_data,
+                    mask[:, :, numpy.newaxis],
+                    out=cropped_pixel_data,
+                )
             else:
-                cropped_pixel_data[~mask] = 0
+                numpy.multiply(cropped_pixel_data, mask, out=cropped_pixel_data)
         if self.shape == SH_OBJECTS:
             # Special handling for objects - masked objects instead of
             # mask and crop mask
@@ -499,8 +525,8 @@ objects:
             )
 
         if save_flag:
-            d[D_FIRST_CROPPING_MASK] = mask
-            d[D_FIRST_CROPPING] = cropping
+            d[D_FIRST_CROPPING_MASK] = _pack_mask(mask)
+            d[D_FIRST_CROPPING] = _pack_mask(cropping)
         #
         # Save the image / cropping / mask
         #
@@ -508,13 +534,17 @@ objects:
         #
         # Save the old and new image sizes
         #
-        original_image_area = numpy.product(orig_image.pixel_data.shape[:2])
-        area_retained_after_cropping = numpy.sum(cropping)
+        original_image_area = (
+            orig_image.pixel_data.shape[0] * orig_image.pixel_data.shape[1]
+        )
+        if cropping_area is None:
+            cropping_area = numpy.count_nonzero(cropping)
+        area_retained_after_cropping = cropping_area
         feature = FF_AREA_RETAINED % self.cropped_image_name.value
         m = workspace.measurements
-        m.add_measurement("Image", feature, numpy.array([area_retained_after_cropping]))
+        m.add_measurement("Image", feature, area_retained_after_cropping)
         feature = FF_ORIGINAL_AREA % self.cropped_image_name.value
-        m.add_measurement("Image", feature, numpy.array([original_image_area]))
+        m.add_measurement("Image", feature, original_image_area)
 
     def display(self, workspace, figure):
         orig_image_pixel_data = workspace.display_data.orig_image_pixel_data
@@ -880,35 +910,57 @@ objects:
         pixel_data = orig_image.pixel_data
         x_max = pixel_data.shape[1]
         y_max = pixel_data.shape[0]
-        if x_radius > y_radius:
-            dist_x = math.sqrt(x_radius ** 2 - y_radius ** 2)
-            dist_y = 0
-            major_radius = x_radius
-        else:
-            dist_x = 0
-            dist_y = math.sqrt(y_radius ** 2 - x_radius ** 2)
-            major_radius = y_radius
-
-        focus_1_x, focus_1_y = (x_center - dist_x, y_center - dist_y)
-        focus_2_x, focus_2_y = (x_center + dist_x, y_center + dist_y)
-        y, x = numpy.mgrid[0:y_max, 0:x_max]
-        d1 = numpy.sqrt((x - focus_1_x) ** 2 + (y - focus_1_y) ** 2)
-        d2 = numpy.sqrt((x - focus_2_x) ** 2 + (y - focus_2_y) ** 2)
-        cropping = d1 + d2 <= major_radius * 2
+        key = (x_max, y_max, x_center, y_center, x_radius, y_radius)
+        if self.__ellipse_cache is not None and self.__ellipse_cache[0] == key:
+            return self.__ellipse_cache[1]
+        #
+        # For an axis-aligned ellipse, the standard form
+        # ((x - cx) / rx)**2 + ((y - cy) / ry)**2 <= 1 is equivalent to the
+        # sum-of-focal-distances test but needs no square roots. float32
+        # halves the memory traffic and is ample precision for image-scale
+        # coordinates.
+        #
+        y, x = numpy.ogrid[0:y_max, 0:x_max]
+        rx2 = numpy.float32(x_radius) ** 2
+        ry2 = numpy.float32(y_radius) ** 2
+        # Fold the separable terms in place on the 1D coordinate vectors;
+        # only the broadcast sum and the boolean mask are full-size
+        x_term = x.astype(numpy.float32)
+        x_term -= x_center
+        x_term *= x_term
+        x_term *= ry2
+        y_term = y.astype(numpy.float32)
+        y_term -= y_center
+        y_term *= y_term
+        y_term *= rx2
+        cropping = numpy.empty((y_max, x_max), bool)
+        numpy.less_equal(x_term + y_term, rx2 * ry2, out=cropping)
+        self.__ellipse_cache = (key, cropping)
         return cropping
 
-    def get_rectangle_cropping(self, workspace, orig_image):
+    def get_rectangle_cropping(self, orig_image):
         """Crop into a rectangle using user-specified coordinates"""
-        cropping = numpy.ones(orig_image.pixel_data.shape[:2], bool)
-        if not self.horizontal_limits.unbounded_min:
-            cropping[:, : self.horizontal_limits.min] = False
-        if not self.horizontal_limits.unbounded_max:
-            cropping[:, self.horizontal_limits.max :] = False
-        if not self.vertical_limits.unbounded_min:
-            cropping[: self.vertical_limits.min, :] = False
-        if not self.vertical_limits.unbounded_max:
-            cropping[self.vertical_limits.max :, :] = False
-        return cropping
+        shape = orig_image.pixel_data.shape[:2]
+        i_min = 0 if self.vertical_limits.unbounded_min else self.vertical_limits.min
+        i_max = (
+            shape[0] if self.vertical_limits.unbounded_max else self.vertical_limits.max
+        )
+        j_min = (
+            0 if self.horizontal_limits.unbounded_min else self.horizontal_limits.min
+        )
+        j_max = (
+            shape[1]
+            if self.horizontal_limits.unbounded_max
+            else self.horizontal_limits.max
+        )
+        # Normalize from-edge (negative) and out-of-range bounds the same way
+        # slicing would, so the retained area can be computed analytically
+        i_start, i_stop, _ = slice(i_min, i_max).indices(shape[0])
+        j_start, j_stop, _ = slice(j_min, j_max).indices(shape[1])
+        cropping = numpy.zeros(shape, bool)
+        cropping[i_start:i_stop, j_start:j_stop] = True
+        area = max(0, i_stop - i_start) * max(0, j_stop - j_start)
+        return cropping, area
 
     def apply_rectangle_cropping(self, workspace, orig_image):
         cropping = numpy.ones(orig_image.pixel_data.shape[:2], bool)
@@ -305,6 +305,55 @@ def test_crop_with_rectangle_float_bounds():
     assert numpy.all(output_image.pixel_data == expected_image)
 
 
+def test_crop_first_cycle_mask_reuse():
+    """Test that the First option reuses the first cycle's cropping"""
+    x, y = numpy.mgrid[0:10, 0:10]
+    input_image = (x / 100.0 + y / 10.0).astype(numpy.float32)
+    image_set_list = cellprofiler_core.image.ImageSetList()
+    module = cellprofiler.modules.crop.Crop()
+    module.set_module_num(1)
+    module.image_name.value = INPUT_IMAGE
+    module.cropped_image_name.value = OUTPUT_IMAGE
+    module.shape.value = cellprofiler.modules.crop.SH_RECTANGLE
+    module.horizontal_limits.set_value((1, 9))
+    module.vertical_limits.set_value((2, 8))
+    module.individual_or_once.value = cellprofiler.modules.crop.IO_FIRST
+    module.remove_rows_and_columns.value = cellprofiler.modules.crop.RM_NO
+    pipeline = cellprofiler_core.pipeline.Pipeline()
+
+    def callback(caller, event):
+        assert not isinstance(event, cellprofiler_core.pipeline.event.RunException)
+
+    pipeline.add_listener(callback)
+    pipeline.add_module(module)
+    m = cellprofiler_core.measurement.Measurements()
+    crop_masks = []
+    pixel_data = []
+    # The third cycle's image is a different size, forcing recalculation
+    images = (input_image, input_image, numpy.zeros((12, 12), numpy.float32))
+    for i, image in enumerate(images):
+        if i != 0:
+            m.next_image_set()
+        m.add_image_measurement(GROUP_NUMBER, 1)
+        m.add_image_measurement(GROUP_INDEX, i + 1)
+        image_set = image_set_list.get_image_set(i)
+        image_set.add(INPUT_IMAGE, cellprofiler_core.image.Image(image))
+        object_set = cellprofiler_core.object.ObjectSet()
+        workspace = cellprofiler_core.workspace.Workspace(
+            pipeline, module, image_set, object_set, m, image_set_list
+        )
+        module.run(workspace)
+        output_image = image_set.get_image(OUTPUT_IMAGE)
+        crop_masks.append(output_image.crop_mask)
+        pixel_data.append(output_image.pixel_data)
+    expected_mask = numpy.zeros((10, 10), bool)
+    expected_mask[2:8, 1:9] = True
+    assert numpy.all(crop_masks[0] == expected_mask)
+    assert numpy.all(crop_masks[1] == crop_masks[0])
+    assert numpy.all(pixel_data[1] == pixel_data[0])
+    assert crop_masks[2].shape == (12, 12)
+
+
 def test_mask_with_objects():
     numpy.random.seed()
     input_image = numpy.random.uniform(size=(20, 10))